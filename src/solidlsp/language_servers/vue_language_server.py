@@ -221,23 +221,27 @@ class VueLanguageServer(SolidLanguageServer):
     def _get_vue_indexing_wait_time(self) -> float:
         return self.VUE_INDEXING_WAIT_TIME
 
-    def _send_references_request(self, relative_file_path: str, line: int, column: int) -> list[lsp_types.Location] | None:
+    def _send_references_request(
+        self, relative_file_path: str, line: int, column: int, include_declaration: bool = False
+    ) -> list[lsp_types.Location] | None:
         uri = PathUtils.path_to_uri(os.path.join(self.repository_root_path, relative_file_path))
         request_params = {
             "textDocument": {"uri": uri},
             "position": {"line": line, "character": column},
-            "context": {"includeDeclaration": False},
+            "context": {"includeDeclaration": include_declaration},
         }
 
         return self.server.send.references(request_params)  # type: ignore[arg-type]
 
-    def _send_ts_references_request(self, relative_file_path: str, line: int, column: int) -> list[ls_types.Location]:
+    def _send_ts_references_request(
+        self, relative_file_path: str, line: int, column: int, include_declaration: bool = True
+    ) -> list[ls_types.Location]:
         assert self._ts_server is not None
         uri = PathUtils.path_to_uri(os.path.join(self.repository_root_path, relative_file_path))
         request_params = {
             "textDocument": {"uri": uri},
             "position": {"line": line, "character": column},
-            "context": {"includeDeclaration": True},
+            "context": {"includeDeclaration": include_declaration},
         }
 
         with self._ts_server.open_file(relative_file_path):
@@ -329,7 +333,11 @@ class VueLanguageServer(SolidLanguageServer):
             return []
 
     @override
-    def request_references(self, relative_file_path: str, line: int, column: int) -> list[ls_types.Location]:
+    def request_references(
+        self, relative_file_path: str, line: int, column: int, include_declaration: bool = True
+    ) -> list[ls_types.Location]:
+        # Unlike the base implementation, the declaration is included by default: the
+        # ts-server reference path has always requested it and Vue callers rely on that.
         if not self.server_started:
             log.error("request_references called before Language Server started")
             raise SolidLSPException("Language Server not started")
@@ -339,7 +347,9 @@ class VueLanguageServer(SolidLanguageServer):
             self._has_waited_for_cross_file_references = True
 
         self._ensure_vue_files_indexed_on_ts_server()
-        symbol_refs = self._send_ts_references_request(relative_file_path, line=line, column=column)
+        symbol_refs = self._send_ts_references_request(
+            relative_file_path, line=line, column=column, include_declaration=include_declaration
+        )
 
         if relative_file_path.endswith(".vue"):
             log.info(f"Attempting to find file-level references for Vue component {relative_file_path}")
@@ -920,16 +920,20 @@ class SolidLanguageServer(ABC):
         return ret
 
     # Some LS cause problems with this, so the call is isolated from the rest to allow overriding in subclasses
-    def _send_references_request(self, relative_file_path: str, line: int, column: int) -> list[lsp_types.Location] | None:
+    def _send_references_request(
+        self, relative_file_path: str, line: int, column: int, include_declaration: bool = False
+    ) -> list[lsp_types.Location] | None:
         return self.server.send.references(
             {
                 "textDocument": {"uri": PathUtils.path_to_uri(os.path.join(self.repository_root_path, relative_file_path))},
                 "position": {"line": line, "character": column},
-                "context": {"includeDeclaration": False},
+                "context": {"includeDeclaration": include_declaration},
             }
         )
 
-    def request_references(self, relative_file_path: str, line: int, column: int) -> list[ls_types.Location]:
+    def request_references(
+        self, relative_file_path: str, line: int, column: int, include_declaration: bool = False
+    ) -> list[ls_types.Location]:
         """
         Raise a [textDocument/references](https://microsoft.github.io/language-server-protocol/specifications/lsp/3.17/specification/#textDocument_references) request to the Language Server
         to find references to the symbol at the given line and column in the given file. Wait for the response and return the result.
@@ -938,6 +942,8 @@ class SolidLanguageServer(ABC):
         :param relative_file_path: The relative path of the file that has the symbol for which references should be looked up
         :param line: The line number of the symbol
         :param column: The column number of the symbol
+        :param include_declaration: whether the declaration itself should be included in the returned
+            references; False (the default) keeps the response payload smaller
 
         :return: A list of locations where the symbol is referenced (excluding ignored directories)
         """
@@ -953,7 +959,9 @@ class SolidLanguageServer(ABC):
                 sleep(self._get_wait_time_for_cross_file_referencing())
                 self._has_waited_for_cross_file_references = True
             try:
-                response = self._send_references_request(relative_file_path, line=line, column=column)
+                response = self._send_references_request(
+                    relative_file_path, line=line, column=column, include_declaration=include_declaration
+                )
             except Exception as e:
                 # Catch LSP internal error (-32603) and raise a more informative exception
                 if isinstance(e, LSPError) and getattr(e, "code", None) == -32603:
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 import os
 import platform
@@ -11,6 +10,7 @@ from dataclasses import dataclass
 from queue import Empty, Queue
 from typing import Any
 
+import orjson
 import psutil
 from sensai.util.string import ToStringMixin
 
@@ -398,12 +398,12 @@ class LanguageServerProcess:
         Parse the body text received from the language server process and invoke the appropriate handler
         """
         try:
-            self._receive_payload(json.loads(body))
+            self._receive_payload(orjson.loads(body))
         except OSError as ex:
             log.error(f"Error processing payload: {ex}", exc_info=ex)
         except UnicodeDecodeError as ex:
             log.error(f"Decoding error for encoding={ENCODING}: {ex}")
-        except json.JSONDecodeError as ex:
+        except orjson.JSONDecodeError as ex:
             log.error(f"JSON decoding error: {ex}")
 
     def _receive_payload(self, payload: StringDict) -> None:
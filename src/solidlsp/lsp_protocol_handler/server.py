@@ -29,11 +29,12 @@ SOFTWARE.
 """
 
 import dataclasses
-import json
 import logging
 import os
 from typing import Any, Union
 
+import orjson
+
 from .lsp_types import ErrorCodes
 
 StringDict = dict[str, Any]
@@ -132,7 +133,9 @@ class StopLoopException(Exception):
 
 
 def create_message(payload: PayloadLike) -> tuple[bytes, bytes, bytes]:
-    body = json.dumps(payload, check_circular=False, ensure_ascii=False, separators=(",", ":")).encode(ENCODING)
+    # orjson serializes to compact UTF-8 bytes directly, several times faster than the
+    # stdlib encoder for the large payloads LSP messages can carry
+    body = orjson.dumps(payload)
     return (
         f"Content-Length: {len(body)}\r\n".encode(ENCODING),
         "Content-Type: application/vscode-jsonrpc; charset=utf-8\r\n\r\n".encode(ENCODING),